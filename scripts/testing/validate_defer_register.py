@@ -8,12 +8,16 @@ Usage:
 from __future__ import annotations
 
 import json
-import re
 import sys
 from datetime import date
 from pathlib import Path
+from typing import Iterator
+
+try:
+    import ijson
+except ImportError:  # optional streaming parser; stdlib json remains the fallback
+    ijson = None
 
-RE_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 RISK_LEVELS = {"P0", "P1", "P2", "P3"}
 REQUIRED_ENTRY_FIELDS = {
     "id",
@@ -28,10 +32,15 @@ REQUIRED_ENTRY_FIELDS = {
     "status",
     "linked_beads",
 }
+# Sorted once at import so per-entry missing-field checks need no re-sort.
+REQUIRED_FIELDS_TUPLE = tuple(sorted(REQUIRED_ENTRY_FIELDS))
 
 
 def parse_iso_date(raw: str, field: str, errors: list[str], entry_id: str) -> date | None:
-    if not isinstance(raw, str) or not RE_DATE.match(raw):
+    # Structural check pins the YYYY-MM-DD form; fromisoformat validates the
+    # rest in C. Length alone is not enough on 3.11+, which also accepts
+    # 10-char compact forms with trailing junk and ISO week dates.
+    if not isinstance(raw, str) or len(raw) != 10 or raw[4] != "-" or raw[7] != "-":
         errors.append(f"{entry_id}: {field} must be YYYY-MM-DD")
         return None
     try:
@@ -41,6 +50,101 @@ def parse_iso_date(raw: str, field: str, errors: list[str], entry_id: str) -> da
         return None
 
 
+def validate_entry(
+    index: int,
+    entry: object,
+    errors: list[str],
+    seen_ids: set[str],
+    today: date,
+) -> None:
+    if not isinstance(entry, dict):
+        errors.append(f"entry[{index}] must be an object")
+        return
+
+    entry_id = entry.get("id", f"entry[{index}]")
+
+    missing = [field for field in REQUIRED_FIELDS_TUPLE if field not in entry]
+    if missing:
+        errors.append(f"{entry_id}: missing required fields: {', '.join(missing)}")
+        return
+
+    if not isinstance(entry["id"], str) or not entry["id"].strip():
+        errors.append(f"entry[{index}]: id must be a non-empty string")
+    elif entry["id"] in seen_ids:
+        errors.append(f"{entry['id']}: duplicate id")
+    else:
+        seen_ids.add(entry["id"])
+
+    if entry.get("risk_rank") not in RISK_LEVELS:
+        errors.append(f"{entry_id}: risk_rank must be one of {sorted(RISK_LEVELS)}")
+
+    for field in ("surface", "owner", "rationale", "status"):
+        value = entry.get(field)
+        if not isinstance(value, str) or not value.strip():
+            errors.append(f"{entry_id}: {field} must be a non-empty string")
+
+    controls = entry.get("compensating_controls")
+    if not isinstance(controls, list) or not controls:
+        errors.append(f"{entry_id}: compensating_controls must be a non-empty array")
+    else:
+        if any(not isinstance(item, str) or not item.strip() for item in controls):
+            errors.append(f"{entry_id}: compensating_controls must contain non-empty strings")
+
+    linked = entry.get("linked_beads")
+    if not isinstance(linked, list) or not linked:
+        errors.append(f"{entry_id}: linked_beads must be a non-empty array")
+    else:
+        if any(not isinstance(item, str) or not item.strip() for item in linked):
+            errors.append(f"{entry_id}: linked_beads must contain non-empty strings")
+
+    created_on = parse_iso_date(entry.get("created_on"), "created_on", errors, entry_id)
+    revisit_on = parse_iso_date(entry.get("revisit_on"), "revisit_on", errors, entry_id)
+    expires_on = parse_iso_date(entry.get("expires_on"), "expires_on", errors, entry_id)
+
+    if created_on and revisit_on and revisit_on < created_on:
+        errors.append(f"{entry_id}: revisit_on must be on/after created_on")
+
+    if expires_on and expires_on < today:
+        errors.append(
+            f"{entry_id}: expires_on={expires_on.isoformat()} is expired (today={today.isoformat()})"
+        )
+
+
+def stream_entries(handle) -> Iterator[object]:
+    """Yield ledger entries one at a time via ijson without building the tree.
+
+    Raises ValueError with the same messages the json.load path prints when
+    the top level is not an object or 'entries' is not an array.
+    """
+    builder = None
+    saw_entries_array = False
+    saw_top_event = False
+    parser = ijson.parse(handle)
+    for prefix, event, value in parser:
+        if not saw_top_event:
+            saw_top_event = True
+            if event != "start_map":
+                raise ValueError("top-level JSON must be an object")
+        if prefix == "entries":
+            if event == "start_array":
+                saw_entries_array = True
+            elif event != "end_array":
+                raise ValueError("top-level 'entries' must be an array")
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "entries.item" and event in ("end_map", "end_array"):
+                yield builder.value
+                builder = None
+        elif prefix == "entries.item":
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            else:
+                yield value
+    if not saw_entries_array:
+        raise ValueError("top-level 'entries' must be an array")
+
+
 def main() -> int:
     if len(sys.argv) != 2:
         print("usage: validate_defer_register.py <path-to-ledger.json>", file=sys.stderr)
@@ -51,79 +155,44 @@ def main() -> int:
         print(f"error: ledger file not found: {ledger_path}", file=sys.stderr)
         return 2
 
-    try:
-        with ledger_path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-    except json.JSONDecodeError as exc:
-        print(f"error: invalid JSON at {ledger_path}: {exc}", file=sys.stderr)
-        return 2
-
     errors: list[str] = []
-
-    if not isinstance(data, dict):
-        print("error: top-level JSON must be an object", file=sys.stderr)
-        return 2
-
-    entries = data.get("entries")
-    if not isinstance(entries, list):
-        print("error: top-level 'entries' must be an array", file=sys.stderr)
-        return 2
-
     seen_ids: set[str] = set()
     today = date.today()
-
-    for index, entry in enumerate(entries):
-        if not isinstance(entry, dict):
-            errors.append(f"entry[{index}] must be an object")
-            continue
-
-        entry_id = entry.get("id", f"entry[{index}]")
-
-        missing = sorted(REQUIRED_ENTRY_FIELDS.difference(entry.keys()))
-        if missing:
-            errors.append(f"{entry_id}: missing required fields: {', '.join(missing)}")
-            continue
-
-        if not isinstance(entry["id"], str) or not entry["id"].strip():
-            errors.append(f"entry[{index}]: id must be a non-empty string")
-        elif entry["id"] in seen_ids:
-            errors.append(f"{entry['id']}: duplicate id")
-        else:
-            seen_ids.add(entry["id"])
-
-        if entry.get("risk_rank") not in RISK_LEVELS:
-            errors.append(f"{entry_id}: risk_rank must be one of {sorted(RISK_LEVELS)}")
-
-        for field in ("surface", "owner", "rationale", "status"):
-            value = entry.get(field)
-            if not isinstance(value, str) or not value.strip():
-                errors.append(f"{entry_id}: {field} must be a non-empty string")
-
-        controls = entry.get("compensating_controls")
-        if not isinstance(controls, list) or not controls:
-            errors.append(f"{entry_id}: compensating_controls must be a non-empty array")
-        else:
-            if any(not isinstance(item, str) or not item.strip() for item in controls):
-                errors.append(f"{entry_id}: compensating_controls must contain non-empty strings")
-
-        linked = entry.get("linked_beads")
-        if not isinstance(linked, list) or not linked:
-            errors.append(f"{entry_id}: linked_beads must be a non-empty array")
-        else:
-            if any(not isinstance(item, str) or not item.strip() for item in linked):
-                errors.append(f"{entry_id}: linked_beads must contain non-empty strings")
-
-        created_on = parse_iso_date(entry.get("created_on"), "created_on", errors, entry_id)
-        revisit_on = parse_iso_date(entry.get("revisit_on"), "revisit_on", errors, entry_id)
-        expires_on = parse_iso_date(entry.get("expires_on"), "expires_on", errors, entry_id)
-
-        if created_on and revisit_on and revisit_on < created_on:
-            errors.append(f"{entry_id}: revisit_on must be on/after created_on")
-
-        if expires_on and expires_on < today:
-            errors.append(
-                f"{entry_id}: expires_on={expires_on.isoformat()} is expired (today={today.isoformat()})"
-            )
+    entry_total = 0
+
+    if ijson is not None:
+        # Streaming path: per-entry memory regardless of ledger size.
+        try:
+            with ledger_path.open("rb") as handle:
+                for index, entry in enumerate(stream_entries(handle)):
+                    validate_entry(index, entry, errors, seen_ids, today)
+                    entry_total += 1
+        except ValueError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 2
+        except ijson.JSONError as exc:
+            print(f"error: invalid JSON at {ledger_path}: {exc}", file=sys.stderr)
+            return 2
+    else:
+        try:
+            with ledger_path.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except json.JSONDecodeError as exc:
+            print(f"error: invalid JSON at {ledger_path}: {exc}", file=sys.stderr)
+            return 2
+
+        if not isinstance(data, dict):
+            print("error: top-level JSON must be an object", file=sys.stderr)
+            return 2
+
+        entries = data.get("entries")
+        if not isinstance(entries, list):
+            print("error: top-level 'entries' must be an array", file=sys.stderr)
+            return 2
+
+        for index, entry in enumerate(entries):
+            validate_entry(index, entry, errors, seen_ids, today)
+        entry_total = len(entries)
 
     if errors:
         print("defer-register validation failed:", file=sys.stderr)
@@ -131,7 +200,7 @@ def main() -> int:
             print(f"- {error}", file=sys.stderr)
         return 1
 
-    print(f"defer-register validation passed ({len(entries)} entries)")
+    print(f"defer-register validation passed ({entry_total} entries)")
     return 0
 
 